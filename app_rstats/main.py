@@ -11,6 +11,8 @@ Endpoints:
     GET  /health              - Returns service status and available rasters
     GET  /rasters             - Lists all registered rasters
     POST /stats/pixel         - Returns a single pixel or small window’s value(s)
+    POST /stats/pixel_val     - Returns one raster's value at a lon/lat point
+    POST /stats/pixel_vals    - Returns one raster's values at many lon/lat points
     POST /stats/geometry      - Computes zonal statistics for a polygon geometry
 
 Dependencies:
@@ -28,8 +30,10 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Tuple, List, Union
+import base64
 import hashlib
 import json
 import logging
@@ -41,6 +45,7 @@ import threading
 import time
 import traceback
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
 
 from affine import Affine
 from dotenv import load_dotenv
@@ -50,11 +55,12 @@ from osgeo import gdal, ogr, osr
 from pydantic import BaseModel
 from pyproj import Geod, Transformer
 from rasterio.errors import WindowError
-from rasterio.features import geometry_mask
+from rasterio.features import rasterize
 from rasterio.mask import mask as rio_mask
-from rasterio.warp import reproject, Resampling
-from rasterio.warp import transform_bounds
+from rasterio.vrt import WarpedVRT
+from rasterio.warp import Resampling
 from rasterio.windows import from_bounds, Window
+import shapely
 from shapely.geometry import GeometryCollection, LineString, MultiPolygon, Polygon
 from shapely.geometry import shape, mapping
 from shapely.ops import split as shp_split
@@ -70,10 +76,13 @@ load_dotenv()
 # this will be mounted in the docker container when it is launched to always
 # point at this yaml
 RASTERS_YAML_PATH = Path("/app/layers.yml")
+# libyaml's C loader is much faster, but only present when PyYAML was built
+# against libyaml
+_YAML_SAFE_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 
 logging.basicConfig(
-    level=logging.DEBUG,
+    level=os.environ.get("RSTATS_LOG_LEVEL", "INFO").upper(),
     format="%(asctime)s [%(levelname)s] %(name)s.%(funcName)s:%(lineno)d - %(message)s",
     datefmt="%Y-%m-%d %H:%M:%S",
 )
@@ -84,14 +93,67 @@ _GEOD = Geod(ellps="WGS84")
 _SQUARE_METERS_PER_HECTARE = 10_000.0
 _LEGEND_KEY_SEPARATOR = "\x00"
 _GEOMETRY_SCATTER_CHUNK_SIZE = 1000
+# max error, in source pixels, of GDAL's linear-approximation transformer when
+# warping one raster onto another's grid (GDAL's APPROX_ERROR_THRESHOLD); this
+# is WarpedVRT's default tolerance, spelled out rather than changed
+_WARP_APPROX_ERROR_THRESHOLD = 0.125
+# working memory, in MB, for each warp of Y onto the X grid; a scatter chunk
+# fits in one warp pass instead of GDAL's default 64 MB tiling
+_WARP_MEM_LIMIT_MB = 256
+# largest drift, in source pixels across the whole target raster, for two
+# grids with slightly different pixel sizes to still be read as aligned
+_ALIGNED_GRID_MAX_DRIFT_PX = 0.01
+# pixels read by /stats/minmax when estimating a raster's range (2**28 bytes
+# at 4 bytes per pixel)
+_MINMAX_MAX_PIXELS = 2**28 // 4
+# /stats/pixel_vals limits: points per request, and the largest bounding
+# window read in one go before falling back to per-pixel reads
+_PIXEL_BATCH_MAX_POINTS = 10_000
+_PIXEL_BATCH_MAX_WINDOW_PIXELS = 1_000_000
 _STATS_JOB_TTL_SECONDS = 15 * 60
-_SCATTER_CACHE_SCHEMA_VERSION = "scatter-cache-v1"
+_SCATTER_CACHE_SCHEMA_VERSION = "scatter-cache-v3"
 _SCATTER_CACHE_PATH = Path(os.environ["RSTATS_CACHE_PATH"])
 _SCATTER_CACHE_MAX_ENTRIES = int(os.environ["RSTATS_CACHE_MAX_ENTRIES"])
 _SCATTER_CACHE_LOCK = threading.Lock()
 _SCATTER_CACHE_INITIALIZED = False
 
 
+# idle rasterio handles per (path, mtime_ns, size); a GDAL dataset handle must
+# not be read from two threads at once, so handles are checked out by
+# _open_raster and handed back by _release_raster, and a file replaced in
+# place gets a new key so handles on the old file are not reused
+_RASTER_HANDLES: dict[tuple, list] = {}
+# pool key each handle checked out by _open_raster was opened under, by id()
+_RASTER_HANDLE_KEYS: dict[int, tuple] = {}
+# last (st_mtime_ns, st_size) seen per raster path with the monotonic time it
+# was taken; _open_raster re-stats a path at most once per TTL, so a file
+# replaced in place is picked up within that many seconds
+_FILE_STAMPS: dict[str, tuple[float, tuple[int, int]]] = {}
+_FILE_STAMPS_LOCK = threading.Lock()
+_FILE_STAMP_TTL_SECONDS = 2.0
+_RASTER_HANDLES_LOCK = threading.Lock()
+_RASTER_HANDLES_PER_PATH = 4
+
+
+@dataclass
+class _WarpedVrtEntry:
+    src: object
+    vrt: WarpedVRT
+    file_stamp: Optional[tuple[int, int]]
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    users: int = 0
+    evicted: bool = False
+
+
+# WarpedVRTs of one raster on another's grid, least recently used first; an
+# entry is checked out by _warped_vrt_on_grid, handed back by
+# _release_warped_vrt, and its VRT and source handle are closed once it has
+# been evicted and no request is still reading from it
+_WARPED_VRTS: dict[tuple, _WarpedVrtEntry] = {}
+_WARPED_VRTS_LOCK = threading.Lock()
+_WARPED_VRTS_MAX = 64
+
+
 class StatsJobCancelled(Exception):
     """Raised when a running stats job is cooperatively cancelled."""
 
@@ -189,7 +251,8 @@ def _update_stats_job(
         if current is None:
             return
         if progress is not None:
-            current.progress = max(0.0, min(1.0, float(progress)))
+            # never step backwards; X and Y report progress concurrently
+            current.progress = max(current.progress, min(1.0, float(progress)))
         if message is not None:
             current.message = message
         if status is not None:
@@ -312,6 +375,7 @@ def _scatter_cache_key(scatter_request: GeometryScatterIn) -> str:
         "histogram_bins": scatter_request.histogram_bins,
         "max_points": scatter_request.max_points,
         "all_touched": scatter_request.all_touched,
+        "full_stats": scatter_request.full_stats,
     }
     return hashlib.sha256(_canonical_json(key_payload).encode("utf-8")).hexdigest()
 
@@ -473,6 +537,9 @@ class GeometryScatterIn(BaseModel):
     histogram_bins: int
     max_points: int
     all_touched: bool
+    # pair every pixel for r/slope/intercept instead of stopping once the
+    # plotted sample is full
+    full_stats: bool = False
     job_id: Optional[str] = None
     session_id: Optional[str] = None
 
@@ -521,14 +588,20 @@ class ScatterOut(BaseModel):
     statistical fields are optional and may be `None` if the window did not cover any
     valid part of the raster.
 
+    Array fields are sent as base64 strings of packed little-endian values
+    rather than JSON lists so large plot payloads avoid per-element encoding.
+
     Attributes:
         raster_id_x (str): Identifier for the X-axis raster layer.
         raster_id_y (str): Identifier for the Y-axis raster layer.
-        x (Optional[List[float]]): List of X-axis pixel values, or None if unavailable.
-        y (Optional[List[float]]): List of Y-axis pixel values, or None if unavailable.
-        hist2d (Optional[List[List[int]]]): 2D histogram counts, or None if unavailable.
-        x_edges (Optional[List[float]]): Bin edges for the X-axis histogram, or None if unavailable.
-        y_edges (Optional[List[float]]): Bin edges for the Y-axis histogram, or None if unavailable.
+        x (Optional[str]): Sampled X-axis pixel values as float32, or None if unavailable.
+        y (Optional[str]): Sampled Y-axis pixel values as float32, or None if unavailable.
+        hist2d (Optional[str]): Row-major [x_bin][y_bin] 2D histogram counts as
+            uint32, or None if unavailable.
+        hist1d_x (Optional[str]): X-axis histogram counts as uint32, or None.
+        hist1d_y (Optional[str]): Y-axis histogram counts as uint32, or None.
+        x_edges (Optional[str]): Bin edges for the X-axis histogram as float64, or None if unavailable.
+        y_edges (Optional[str]): Bin edges for the Y-axis histogram as float64, or None if unavailable.
         x_summary (Optional[RasterSummary]): Valid-value summary for the X-axis raster.
         y_summary (Optional[RasterSummary]): Valid-value summary for the Y-axis raster.
         x_categories (Optional[List[CategoryAreaSummary]]): Category area summaries for the X-axis raster.
@@ -544,13 +617,13 @@ class ScatterOut(BaseModel):
 
     raster_id_x: Optional[str]
     raster_id_y: Optional[str]
-    x: Optional[List[float]] = None
-    y: Optional[List[float]] = None
-    hist2d: Optional[List[List[int]]] = None
-    hist1d_x: Optional[List[int]] = None
-    hist1d_y: Optional[List[int]] = None
-    x_edges: Optional[List[float]] = None
-    y_edges: Optional[List[float]] = None
+    x: Optional[str] = None
+    y: Optional[str] = None
+    hist2d: Optional[str] = None
+    hist1d_x: Optional[str] = None
+    hist1d_y: Optional[str] = None
+    x_edges: Optional[str] = None
+    y_edges: Optional[str] = None
     x_summary: Optional[RasterSummary] = None
     y_summary: Optional[RasterSummary] = None
     x_categories: Optional[List[CategoryAreaSummary]] = None
@@ -563,10 +636,63 @@ class ScatterOut(BaseModel):
     geometry: dict
 
 
+def _encode_array(values: Optional[np.ndarray], dtype: str) -> Optional[str]:
+    """Return ``values`` packed as ``dtype`` bytes and base64 encoded."""
+    if values is None:
+        return None
+    packed = np.ascontiguousarray(values, dtype=dtype)
+    return base64.b64encode(packed.tobytes()).decode("ascii")
+
+
+@lru_cache(maxsize=256)
+def _get_transformer(from_crs: str, to_crs: str) -> Transformer:
+    """Return a cached always-xy transformer between two CRS strings.
+
+    Building a PROJ transformation dominates short requests, and pyproj
+    transformers are safe to share between threads, so one instance is kept
+    per CRS pair for the life of the process.
+
+    Args:
+        from_crs (str): Source CRS as an authority string (e.g. ``EPSG:4326``)
+            or WKT, e.g. ``rasterio.crs.CRS.to_string()``.
+        to_crs (str): Target CRS in the same forms.
+
+    Returns:
+        Transformer: Transformer with ``always_xy=True``.
+    """
+    return Transformer.from_crs(from_crs, to_crs, always_xy=True)
+
+
+def _transform_geometry(geom, transformer: Transformer):
+    """Reproject a shapely geometry with a single batched PROJ call.
+
+    All vertices are handed to ``transformer`` as one coordinate array instead
+    of one callback per ring or point. Z values, if present, are kept as is.
+
+    Args:
+        geom: Shapely geometry in the transformer's source CRS.
+        transformer (Transformer): Always-xy transformer, e.g. from
+            `_get_transformer`.
+
+    Returns:
+        Shapely geometry of the same type in the transformer's target CRS.
+    """
+
+    def _apply(coords):
+        xs, ys = transformer.transform(coords[:, 0], coords[:, 1])
+        out = coords.copy()
+        out[:, 0] = xs
+        out[:, 1] = ys
+        return out
+
+    return shapely.transform(geom, _apply, include_z=bool(shapely.has_z(geom)))
+
+
 def valid_area_hectares(
     valid_mask: np.ndarray,
     affine: Affine,
     raster_crs: rasterio.crs.CRS,
+    pixel_count: Optional[int] = None,
 ) -> float:
     """Estimate sampled valid raster area in hectares.
 
@@ -575,6 +701,8 @@ def valid_area_hectares(
             pixels inside the requested geometry.
         affine: Affine transform for the sampled array.
         raster_crs: Coordinate reference system for the sampled raster.
+        pixel_count: Number of True pixels in ``valid_mask`` when the caller
+            already knows it; saves a full count for projected rasters.
 
     Returns:
         Valid sampled area in hectares.
@@ -583,16 +711,16 @@ def valid_area_hectares(
     if raster_crs.is_projected:
         unit_factor = raster_crs.linear_units_factor[1]
         pixel_area = abs(affine.a * affine.e - affine.b * affine.d)
-        area_m2 = np.count_nonzero(valid_mask) * pixel_area * unit_factor**2
+        if pixel_count is None:
+            pixel_count = np.count_nonzero(valid_mask)
+        area_m2 = pixel_count * pixel_area * unit_factor**2
         return float(area_m2 / _SQUARE_METERS_PER_HECTARE)
 
     row_counts = np.count_nonzero(valid_mask, axis=1)
     rows = np.flatnonzero(row_counts)
     transformer_obj = None
     if raster_crs.to_epsg() != 4326:
-        transformer_obj = Transformer.from_crs(
-            raster_crs, "EPSG:4326", always_xy=True
-        )
+        transformer_obj = _get_transformer(raster_crs.to_string(), "EPSG:4326")
 
     area_m2 = 0.0
     for row_index in rows:
@@ -729,9 +857,7 @@ def categorical_area_totals(
         row_area_hectares = {}
         transformer_obj = None
         if raster_crs.to_epsg() != 4326:
-            transformer_obj = Transformer.from_crs(
-                raster_crs, "EPSG:4326", always_xy=True
-            )
+            transformer_obj = _get_transformer(raster_crs.to_string(), "EPSG:4326")
 
     for row_index in np.flatnonzero(np.count_nonzero(valid_mask, axis=1)):
         if default_area is None:
@@ -862,6 +988,35 @@ class PixelValOut(BaseModel):
     value: Optional[Union[float, str]] = None
 
 
+class PixelValsIn(BaseModel):
+    """Input model for a batched pixel value query on one raster.
+
+    Attributes:
+        raster_id (str): Identifier of the target raster in the registry.
+        lons (list[float]): Longitudes (or X) of the query coordinates in
+            `from_crs`.
+        lats (list[float]): Latitudes (or Y), same length as `lons`.
+        from_crs (str): CRS of the input coordinates, default 'EPSG:4326'.
+    """
+
+    raster_id: str
+    lons: list[float]
+    lats: list[float]
+    from_crs: str = "EPSG:4326"
+
+
+class PixelValsOut(BaseModel):
+    """Output model for a batched pixel value query.
+
+    Attributes:
+        raster_id (str): Identifier of the raster queried.
+        points (list[PixelValOut]): One result per input coordinate, in order.
+    """
+
+    raster_id: str
+    points: list[PixelValOut]
+
+
 class ClipIn(BaseModel):
     """Input model for raster clipping requests.
 
@@ -912,48 +1067,10 @@ def _reproject_geojson_geoms(gj: dict, from_crs: str, to_crs) -> list[dict]:
     if not to_crs or not from_crs or from_crs == to_crs.to_string():
         return _extract_geometries(gj)
 
-    tf = Transformer.from_crs(from_crs, to_crs, always_xy=True)
-
-    def _tx_point(pt):
-        if len(pt) == 2:
-            x, y = tf.transform(pt[0], pt[1])
-            return [x, y]
-        x, y, z = pt[0], pt[1], pt[2]
-        x2, y2 = tf.transform(x, y)
-        return [x2, y2, z]
-
-    def _map_coords(coords):
-        if (
-            isinstance(coords, (list, tuple))
-            and coords
-            and isinstance(coords[0], (int, float))
-        ):
-            return _tx_point(coords)
-        return [_map_coords(c) for c in coords]
-
-    def _tx_geometry(geom):
-        gtype = geom.get("type")
-        if gtype in (
-            "Point",
-            "MultiPoint",
-            "LineString",
-            "MultiLineString",
-            "Polygon",
-            "MultiPolygon",
-        ):
-            return {
-                "type": gtype,
-                "coordinates": _map_coords(geom.get("coordinates", [])),
-            }
-        if gtype == "GeometryCollection":
-            return {
-                "type": "GeometryCollection",
-                "geometries": [_tx_geometry(g) for g in geom.get("geometries", [])],
-            }
-        return geom
-
-    geoms = _extract_geometries(gj)
-    return [_tx_geometry(g) for g in geoms]
+    tf = _get_transformer(from_crs, to_crs.to_string())
+    return [
+        mapping(_transform_geometry(shape(g), tf)) for g in _extract_geometries(gj)
+    ]
 
 
 def _extract_geometries(geojson_obj: dict) -> list[dict]:
@@ -1053,12 +1170,17 @@ def _clip_and_write_tif(
         dst.write(out_image)
 
 
+@lru_cache(maxsize=1)
 def _load_layers_yaml() -> dict:
-    """Load expanded layers YAML config."""
+    """Load expanded layers YAML config.
+
+    The file is read and parsed once per process, with libyaml's C loader
+    when PyYAML was built against it; every caller shares the parsed dict.
+    """
     if not RASTERS_YAML_PATH.exists():
         raise RuntimeError(f"{RASTERS_YAML_PATH} not found")
     raw_yaml = RASTERS_YAML_PATH.read_text()
-    return yaml.safe_load(os.path.expandvars(raw_yaml)) or {}
+    return yaml.load(os.path.expandvars(raw_yaml), Loader=_YAML_SAFE_LOADER) or {}
 
 
 def _load_registry() -> dict:
@@ -1211,21 +1333,100 @@ def _sample_vector_features():
         dataset = None
 
 
-def _open_raster(raster_id: str):
+def _working_dtype(ds) -> np.dtype:
+    """Return the narrowest float dtype that holds a raster's values exactly.
+
+    Byte, 16-bit integer and float32 rasters are worked on as float32, which
+    halves memory traffic compared with float64; 32-bit integer and float64
+    rasters stay float64 so no precision is lost.
+
+    Args:
+        ds (rasterio.io.DatasetReader): Open raster dataset.
+
+    Returns:
+        np.dtype: ``float32`` or ``float64``.
+    """
+    return np.result_type(np.dtype(ds.dtypes[0]), np.float32)
+
+
+def _nodata_hits(values: np.ndarray, nodata: float) -> np.ndarray:
+    """Return a boolean mask of ``values`` equal to a nodata sentinel.
+
+    Integral sentinels (-9999, 0, 255, ...) are exactly representable in the
+    float arrays we read, so they are matched with plain equality; only
+    fractional sentinels fall back to the much slower ``np.isclose``.
+
+    Args:
+        values (np.ndarray): Raster values.
+        nodata (float): Finite nodata value, as resolved by `_open_raster`.
+
+    Returns:
+        np.ndarray: Boolean array shaped like ``values``.
+    """
+    if float(nodata).is_integer():
+        return values == nodata
+    return np.isclose(values, nodata)
+
+
+def _file_stamp(path) -> Optional[tuple[int, int]]:
+    """Return ``(st_mtime_ns, st_size)`` for ``path``, or None if it is missing.
+
+    Used to notice a raster file that was replaced in place, so handles opened
+    on the old file are not reused.
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _recent_file_stamp(path) -> Optional[tuple[int, int]]:
+    """Return `_file_stamp` for ``path``, reusing one taken within the TTL.
+
+    A missing file is not cached, so it is noticed as soon as it reappears.
+    """
+    now = time.monotonic()
+    with _FILE_STAMPS_LOCK:
+        cached = _FILE_STAMPS.get(path)
+    if cached is not None and now - cached[0] < _FILE_STAMP_TTL_SECONDS:
+        return cached[1]
+    file_stamp = _file_stamp(path)
+    with _FILE_STAMPS_LOCK:
+        if file_stamp is None:
+            _FILE_STAMPS.pop(path, None)
+        else:
+            _FILE_STAMPS[path] = (now, file_stamp)
+    return file_stamp
+
+
+def _open_raster(raster_id: str, stats_nodata: bool = True):
     """Open a registered raster dataset and return its metadata.
 
     Looks up the raster entry from the global `REGISTRY` using the provided
-    raster ID, verifies that the file exists, and opens it with Rasterio.
-    Returns the dataset handle along with its nodata value and units.
+    raster ID, checks that the file exists, and checks out an idle handle
+    opened on the file's current size and modification time, opening a new
+    one with Rasterio if none is idle. The file is stat'ed at most once per
+    `_FILE_STAMP_TTL_SECONDS` across requests. Idle handles on an earlier
+    version of the file are closed. Returns the dataset handle along with its nodata
+    value. Pass the handle to `_release_raster` when done so later requests
+    can reuse it.
 
     Args:
         raster_id (str): Identifier of the raster to open, matching an entry
             in `REGISTRY`.
+        stats_nodata (bool): Resolve nodata for computing statistics, falling
+            back to the layer's rendering config. Pass False to get the
+            registry or dataset value unchanged, as clipped downloads write it
+            into the output file.
 
     Returns:
         tuple:
             ds (rasterio.io.DatasetReader): Opened Rasterio dataset.
-            nodata (float | None): Nodata value from metadata or dataset.
+            nodata (float | None): Nodata value from metadata, the dataset, or
+                (for stats) the layer's rendering config, in that order. For
+                stats a NaN nodata is returned as None since callers already
+                drop non-finite pixels.
 
     Raises:
         HTTPException: If the raster ID is not found in the registry (404) or
@@ -1235,13 +1436,286 @@ def _open_raster(raster_id: str):
     if not meta:
         raise HTTPException(status_code=404, detail=f"raster_id not found: {raster_id}")
     path = meta["file_path"]
-    if not Path(path).exists():
+    file_stamp = _recent_file_stamp(path)
+    if file_stamp is None:
         raise HTTPException(status_code=500, detail=f"raster file missing: {path}")
-    ds = rasterio.open(path)
+    key = (path, *file_stamp)
+    stale = []
+    with _RASTER_HANDLES_LOCK:
+        for other_key in [k for k in _RASTER_HANDLES if k[0] == path and k != key]:
+            stale.extend(_RASTER_HANDLES.pop(other_key))
+        for old_ds in stale:
+            _RASTER_HANDLE_KEYS.pop(id(old_ds), None)
+        idle = _RASTER_HANDLES.get(key)
+        ds = idle.pop() if idle else None
+    for old_ds in stale:
+        old_ds.close()
+    if ds is None:
+        ds = rasterio.open(path)
+        with _RASTER_HANDLES_LOCK:
+            _RASTER_HANDLE_KEYS[id(ds)] = key
     nodata = meta.get("nodata", ds.nodata)
+    if not stats_nodata:
+        return ds, nodata
+    if nodata is None:
+        nodata = (meta.get("rendering") or {}).get("nodata")
+    if nodata is not None:
+        nodata = float(nodata)
+        if not np.isfinite(nodata):
+            nodata = None
     return ds, nodata
 
 
+def _release_raster(ds) -> None:
+    """Return a handle from `_open_raster` to the idle pool for reuse.
+
+    The handle is pooled under the file version it was opened on; handles
+    beyond `_RASTER_HANDLES_PER_PATH` idle per version are closed.
+
+    Args:
+        ds (rasterio.io.DatasetReader | None): Handle to release; None and
+            closed handles are ignored.
+    """
+    if ds is None or ds.closed:
+        return
+    with _RASTER_HANDLES_LOCK:
+        key = _RASTER_HANDLE_KEYS.get(id(ds))
+        if key is not None:
+            idle = _RASTER_HANDLES.setdefault(key, [])
+            if len(idle) < _RASTER_HANDLES_PER_PATH:
+                idle.append(ds)
+                return
+            del _RASTER_HANDLE_KEYS[id(ds)]
+    ds.close()
+
+
+def _retire_warped_vrts(entries: list) -> list:
+    """Mark entries dropped from `_WARPED_VRTS` as evicted.
+
+    Must be called with `_WARPED_VRTS_LOCK` held.
+
+    Args:
+        entries (list): `_WarpedVrtEntry` objects (or None) removed from the
+            cache.
+
+    Returns:
+        list: The entries no request is using, which the caller should pass to
+            `_close_warped_vrt` after releasing the lock.
+    """
+    idle = []
+    for entry in entries:
+        if entry is None:
+            continue
+        entry.evicted = True
+        if entry.users == 0:
+            idle.append(entry)
+    return idle
+
+
+def _close_warped_vrt(entry: _WarpedVrtEntry) -> None:
+    """Close an evicted `_WarpedVrtEntry`'s VRT and source handle."""
+    entry.vrt.close()
+    entry.src.close()
+
+
+def _warped_vrt_on_grid(
+    src_path: str,
+    src_nodata: Optional[float],
+    dst_crs_wkt: str,
+    dst_transform: Affine,
+    dst_width: int,
+    dst_height: int,
+) -> _WarpedVrtEntry:
+    """Check out a cached float view of a raster resampled onto another grid.
+
+    Building the warp pipeline (PROJ transformation and GDAL warper setup) is
+    the expensive part of pairing two rasters, so the VRT is kept open and
+    reused by every request pairing the same rasters. It is rebuilt when the
+    source file's size or modification time changes, and the least recently
+    used of more than `_WARPED_VRTS_MAX` VRTs is evicted. Source coordinates
+    are interpolated linearly along each scanline within
+    ``_WARP_APPROX_ERROR_THRESHOLD`` pixels rather than projected exactly per
+    pixel, and each warp is spread across all cores. Pixels that are nodata
+    in the source or fall outside it read back as NaN. Pass the entry to
+    `_release_warped_vrt` when done.
+
+    Args:
+        src_path (str): Path of the raster to resample.
+        src_nodata (Optional[float]): Nodata value of the source raster, or
+            None to treat every source value as valid.
+        dst_crs_wkt (str): WKT of the target grid CRS.
+        dst_transform (Affine): Affine transform of the target grid.
+        dst_width (int): Width of the target grid in pixels.
+        dst_height (int): Height of the target grid in pixels.
+
+    Returns:
+        _WarpedVrtEntry: Entry whose ``vrt`` is a nearest-neighbour warped view
+            on the target grid, typed as the source's `_working_dtype`. Hold
+            its ``lock`` while reading from ``vrt``; a GDAL dataset handle is
+            not safe for concurrent reads.
+    """
+    key = (src_path, src_nodata, dst_crs_wkt, dst_transform, dst_width, dst_height)
+    file_stamp = _file_stamp(src_path)
+    to_close = []
+    with _WARPED_VRTS_LOCK:
+        entry = _WARPED_VRTS.pop(key, None)
+        if entry is not None and entry.file_stamp != file_stamp:
+            # the file was replaced since this VRT was built
+            to_close = _retire_warped_vrts([entry])
+            entry = None
+        if entry is not None:
+            entry.users += 1
+            _WARPED_VRTS[key] = entry
+    for stale in to_close:
+        _close_warped_vrt(stale)
+    if entry is not None:
+        return entry
+
+    src = rasterio.open(src_path)
+    vrt = WarpedVRT(
+        src,
+        crs=dst_crs_wkt,
+        transform=dst_transform,
+        width=dst_width,
+        height=dst_height,
+        resampling=Resampling.nearest,
+        tolerance=_WARP_APPROX_ERROR_THRESHOLD,
+        src_nodata=src_nodata,
+        nodata=np.nan,
+        dtype=_working_dtype(src).name,
+        warp_mem_limit=_WARP_MEM_LIMIT_MB,
+        NUM_THREADS="ALL_CPUS",
+    )
+    entry = _WarpedVrtEntry(src=src, vrt=vrt, file_stamp=file_stamp, users=1)
+    with _WARPED_VRTS_LOCK:
+        # another request may have built the same VRT meanwhile; the newest
+        # one replaces it
+        evicted = [_WARPED_VRTS.pop(key, None)]
+        _WARPED_VRTS[key] = entry
+        while len(_WARPED_VRTS) > _WARPED_VRTS_MAX:
+            evicted.append(_WARPED_VRTS.pop(next(iter(_WARPED_VRTS))))
+        to_close = _retire_warped_vrts(evicted)
+    for stale in to_close:
+        _close_warped_vrt(stale)
+    return entry
+
+
+def _release_warped_vrt(entry: Optional[_WarpedVrtEntry]) -> None:
+    """Hand back an entry from `_warped_vrt_on_grid`.
+
+    Args:
+        entry (Optional[_WarpedVrtEntry]): Entry to release; None is ignored.
+    """
+    if entry is None:
+        return
+    with _WARPED_VRTS_LOCK:
+        entry.users -= 1
+        close = entry.evicted and entry.users == 0
+    if close:
+        _close_warped_vrt(entry)
+
+
+def _aligned_pixel_offset(src_ds, dst_ds) -> Optional[tuple[int, int]]:
+    """Return the whole-pixel offset of ``dst_ds``'s grid inside ``src_ds``'s.
+
+    Args:
+        src_ds: Open rasterio dataset to be read on the other grid.
+        dst_ds: Open rasterio dataset whose grid defines the target pixels.
+
+    Returns:
+        Optional[tuple[int, int]]: ``(col_off, row_off)`` of the target origin
+            in source pixels when both rasters share a CRS and orientation,
+            their pixel sizes drift apart by at most
+            ``_ALIGNED_GRID_MAX_DRIFT_PX`` across the target, and their
+            origins differ by whole pixels, otherwise None.
+    """
+    if src_ds.crs != dst_ds.crs:
+        return None
+    src_t = src_ds.transform
+    dst_t = dst_ds.transform
+    if src_t.b != 0 or src_t.d != 0 or dst_t.b != 0 or dst_t.d != 0:
+        return None
+    # an absolute tolerance on pixel size is about a pixel wide on geographic
+    # grids, so bound how far the grids drift apart across the target instead
+    col_drift = abs(src_t.a - dst_t.a) * dst_ds.width / abs(src_t.a)
+    row_drift = abs(src_t.e - dst_t.e) * dst_ds.height / abs(src_t.e)
+    if col_drift > _ALIGNED_GRID_MAX_DRIFT_PX or row_drift > _ALIGNED_GRID_MAX_DRIFT_PX:
+        return None
+    col_off = (dst_t.c - src_t.c) / src_t.a
+    row_off = (dst_t.f - src_t.f) / src_t.e
+    col_int = round(col_off)
+    row_int = round(row_off)
+    if abs(col_off - col_int) > 1e-6 or abs(row_off - row_int) > 1e-6:
+        return None
+    return int(col_int), int(row_int)
+
+
+def _read_aligned_window(
+    src_ds,
+    src_nodata: Optional[float],
+    offset: tuple[int, int],
+    dst_win: Window,
+    out_shape: Optional[tuple[int, int]] = None,
+) -> np.ndarray:
+    """Read a target-grid window straight from a pixel-aligned source raster.
+
+    Args:
+        src_ds: Open rasterio dataset sharing the target grid's pixels.
+        src_nodata (Optional[float]): Nodata value of ``src_ds``, or None.
+        offset (tuple[int, int]): ``(col_off, row_off)`` from
+            ``_aligned_pixel_offset``.
+        dst_win (Window): Window on the target grid.
+        out_shape (Optional[tuple[int, int]]): ``(rows, cols)`` to
+            nearest-neighbour decimate the window to, as a decimated read of
+            ``_warped_vrt_on_grid`` would, or None for full resolution.
+
+    Returns:
+        np.ndarray: Values for ``dst_win`` in the source's `_working_dtype`,
+            shaped ``out_shape`` when given; nodata and pixels outside the
+            source read back as NaN, matching ``_warped_vrt_on_grid``.
+    """
+    height = int(dst_win.height)
+    width = int(dst_win.width)
+    work_dtype = _working_dtype(src_ds)
+    col0 = int(dst_win.col_off) + offset[0]
+    row0 = int(dst_win.row_off) + offset[1]
+    src_col0 = max(col0, 0)
+    src_row0 = max(row0, 0)
+    src_col1 = min(col0 + width, src_ds.width)
+    src_row1 = min(row0 + height, src_ds.height)
+    if src_col1 <= src_col0 or src_row1 <= src_row0:
+        return np.full(out_shape or (height, width), np.nan, dtype=work_dtype)
+
+    inside = (src_col1 - src_col0, src_row1 - src_row0) == (width, height)
+    values = src_ds.read(
+        1,
+        window=Window(
+            src_col0, src_row0, src_col1 - src_col0, src_row1 - src_row0
+        ),
+        # GDAL decimates (from overviews when present) only when the whole
+        # window is in the source; edge windows are decimated below
+        out_shape=out_shape if inside else None,
+        resampling=Resampling.nearest,
+    ).astype(work_dtype, copy=False)
+    if src_nodata is not None:
+        np.putmask(values, _nodata_hits(values, src_nodata), np.nan)
+    if inside:
+        # the read itself is the result and no NaN-filled destination is
+        # needed
+        return values
+    out = np.full((height, width), np.nan, dtype=work_dtype)
+    out[
+        src_row0 - row0 : src_row1 - row0,
+        src_col0 - col0 : src_col1 - col0,
+    ] = values
+    if out_shape is None:
+        return out
+    # pick the pixel under each output cell's centre, as GDAL's nearest does
+    rows = ((np.arange(out_shape[0]) + 0.5) * (height / out_shape[0])).astype(int)
+    cols = ((np.arange(out_shape[1]) + 0.5) * (width / out_shape[1])).astype(int)
+    return out[np.ix_(rows, cols)]
+
+
 app = FastAPI(title="ESSOSC Raster Stats API", version="0.1.0")
 
 # Enable Cross-Origin Resource Sharing (CORS) for the API
@@ -1388,7 +1862,7 @@ def get_best_overview(band):
     """Returns the highest-resolution overview that fits within a memory budget.
 
     This scans overviews for band 1 (from highest to lowest resolution) and returns
-    the first overview whose pixel count fits within 2*28 bytes assuming
+    the first overview whose pixel count fits within 2**28 bytes assuming
     4 bytes per pixel.
 
     Args:
@@ -1398,17 +1872,37 @@ def get_best_overview(band):
       A GDAL RasterBand overview (RasterBand) for band 1 that fits the budget, or
       None if no available overview fits.
     """
-    max_bytes = 2**28
-    element_bytesize = 4
-    max_elements = max_bytes / element_bytesize
-
     for i in range(band.GetOverviewCount()):
-        print(f"trying {i}")
         overview = band.GetOverview(i)
-        if overview.XSize * overview.YSize < max_elements:
+        if overview.XSize * overview.YSize < _MINMAX_MAX_PIXELS:
             return overview
 
 
+def _read_within_budget(band) -> np.ndarray:
+    """Read a band at the finest resolution that fits the minmax budget.
+
+    Uses the best fitting overview when there is one; otherwise (no
+    overviews, or none small enough) reads the band itself, decimated by
+    GDAL with nearest neighbour just enough to fit.
+
+    Args:
+        band: A GDAL RasterBand.
+
+    Returns:
+        np.ndarray: 2D array of band values.
+    """
+    overview = get_best_overview(band)
+    if overview is not None:
+        return overview.ReadAsArray()
+    step = int(np.ceil(np.sqrt(band.XSize * band.YSize / _MINMAX_MAX_PIXELS)))
+    step = max(step, 1)
+    return band.ReadAsArray(
+        buf_xsize=max(1, band.XSize // step),
+        buf_ysize=max(1, band.YSize // step),
+        resample_alg=gdal.GRIORA_NearestNeighbour,
+    )
+
+
 @app.post("/stats/minmax", response_model=RasterMinMaxOut)
 def minmax_stats(r: RasterMinMaxIn):
     """Compute approximate 5th and 95th percentile values for a raster.
@@ -1443,12 +1937,16 @@ def minmax_stats(r: RasterMinMaxIn):
         file_path = REGISTRY[r.raster_id]["file_path"]
         raster = gdal.Open(file_path, gdal.GA_ReadOnly)
         band = raster.GetRasterBand(1)
-        overview = get_best_overview(band)
-        array = overview.ReadAsArray()
+        array = _read_within_budget(band)
         nodata = band.GetNoDataValue()
+        valid = np.isfinite(array)
         if nodata is not None:
-            array = array[(array != nodata) & (np.isfinite(array))]
-        p5, p95 = np.percentile(array, [5, 95])
+            valid &= array != nodata
+        array = array[valid]
+        # np.percentile already selects with np.partition (O(N)); the masked
+        # array is our own copy, so let it partition in place instead of
+        # allocating another scratch copy
+        p5, p95 = np.percentile(array, [5, 95], overwrite_input=True)
         return RasterMinMaxOut(raster_id=r.raster_id, min_=p5, max_=p95)
     except Exception as e:
         logger.exception("minmax_stats failed")
@@ -1581,13 +2079,12 @@ def _safe_window_for_geom(dataset, geometry):
 
     if int(padded_window.width) == 0 or int(padded_window.height) == 0:
         # if we get here it means for some reason our intersection
-        # was still 0, so we'll just try to grab a pixel
-        centroid_x, centroid_y = (
-            geometry.centroid.x,
-            geometry.centroid.y,
-        )
+        # was still 0, so we'll just try to grab a pixel at the middle of
+        # the bounds we already have rather than asking GEOS for a centroid
+        center_x = 0.5 * (geometry_bounds[0] + geometry_bounds[2])
+        center_y = 0.5 * (geometry_bounds[1] + geometry_bounds[3])
         row_idx, col_idx = rasterio.transform.rowcol(
-            dataset.transform, centroid_x, centroid_y
+            dataset.transform, center_x, center_y
         )
         row_idx = min(max(row_idx, 0), dataset.height - 1)
         col_idx = min(max(col_idx, 0), dataset.width - 1)
@@ -1624,31 +2121,75 @@ def _shape_for_pixel_budget(win, max_pixels):
     return out_h, out_w
 
 
-def _iter_window_chunks(win: Window, chunk_size: int = _GEOMETRY_SCATTER_CHUNK_SIZE):
-    """Yield bounded integer windows covering a larger raster window."""
+def _chunk_spans(
+    start: int, stop: int, chunk_size: int, block_size: Optional[int] = None
+) -> list[tuple[int, int]]:
+    """Split ``[start, stop)`` into chunks whose inner edges sit on block edges.
+
+    Args:
+        start (int): First pixel offset covered.
+        stop (int): Pixel offset one past the last covered.
+        chunk_size (int): Target chunk length in pixels.
+        block_size (Optional[int]): Internal block length of the raster along
+            this axis. When it fits in ``chunk_size``, the chunk length is
+            rounded down to a whole number of blocks and chunk edges are
+            snapped to the absolute block grid so no block is decoded by two
+            chunks. Larger blocks (e.g. full-width strips) are ignored.
+
+    Returns:
+        list[tuple[int, int]]: ``(offset, length)`` pairs covering the span.
+    """
+    if not block_size or block_size <= 0 or block_size > chunk_size:
+        return [
+            (offset, min(chunk_size, stop - offset))
+            for offset in range(start, stop, chunk_size)
+        ]
+    step = (chunk_size // block_size) * block_size
+    spans = []
+    offset = start
+    while offset < stop:
+        next_edge = min(stop, (offset // step + 1) * step)
+        spans.append((offset, next_edge - offset))
+        offset = next_edge
+    return spans
+
+
+def _iter_window_chunks(
+    win: Window,
+    chunk_size: int = _GEOMETRY_SCATTER_CHUNK_SIZE,
+    block_shape: Optional[tuple[int, int]] = None,
+):
+    """Yield bounded integer windows covering a larger raster window.
+
+    ``block_shape`` is the raster's ``(rows, cols)`` internal block size;
+    when given, chunk edges follow the block grid (see ``_chunk_spans``).
+    """
     col_start = int(win.col_off)
     row_start = int(win.row_off)
     col_stop = int(np.ceil(win.col_off + win.width))
     row_stop = int(np.ceil(win.row_off + win.height))
+    block_rows, block_cols = block_shape or (None, None)
 
-    for row_off in range(row_start, row_stop, chunk_size):
-        height = min(chunk_size, row_stop - row_off)
-        if height <= 0:
-            continue
-        for col_off in range(col_start, col_stop, chunk_size):
-            width = min(chunk_size, col_stop - col_off)
-            if width <= 0:
-                continue
+    col_spans = _chunk_spans(col_start, col_stop, chunk_size, block_cols)
+    for row_off, height in _chunk_spans(row_start, row_stop, chunk_size, block_rows):
+        for col_off, width in col_spans:
             yield Window(col_off, row_off, width, height)
 
 
-def _window_chunk_count(win: Window, chunk_size: int = _GEOMETRY_SCATTER_CHUNK_SIZE):
+def _window_chunk_count(
+    win: Window,
+    chunk_size: int = _GEOMETRY_SCATTER_CHUNK_SIZE,
+    block_shape: Optional[tuple[int, int]] = None,
+):
     """Return the number of bounded chunks needed to cover a raster window."""
-    width = max(0, int(np.ceil(win.col_off + win.width)) - int(win.col_off))
-    height = max(0, int(np.ceil(win.row_off + win.height)) - int(win.row_off))
-    if width <= 0 or height <= 0:
-        return 0
-    return int(np.ceil(width / chunk_size) * np.ceil(height / chunk_size))
+    col_start = int(win.col_off)
+    row_start = int(win.row_off)
+    col_stop = int(np.ceil(win.col_off + win.width))
+    row_stop = int(np.ceil(win.row_off + win.height))
+    block_rows, block_cols = block_shape or (None, None)
+    return len(_chunk_spans(row_start, row_stop, chunk_size, block_rows)) * len(
+        _chunk_spans(col_start, col_stop, chunk_size, block_cols)
+    )
 
 
 def _window_plans_for_geom(dataset, geometry):
@@ -1671,19 +2212,86 @@ def _histogram_edges(min_value: float, max_value: float, bins: int) -> np.ndarra
     return np.linspace(min_value, max_value, bins + 1)
 
 
+def _uniform_bin_index(
+    values: np.ndarray, edges: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return bin indices for ``values`` on evenly spaced ``edges``.
+
+    Args:
+        values (np.ndarray): 1D values to bin.
+        edges (np.ndarray): Evenly spaced, increasing bin edges.
+
+    Returns:
+        tuple:
+            index (np.ndarray): Bin index per value (int64); bins are
+                half-open ``[edges[i], edges[i + 1])`` except the last, which
+                is closed, matching ``np.histogram``.
+            in_range (np.ndarray): Boolean mask of values inside the edges.
+    """
+    bins = edges.size - 1
+    lo = float(edges[0])
+    hi = float(edges[-1])
+    in_range = (values >= lo) & (values <= hi)
+    offsets = np.subtract(values, lo, dtype="float64")
+    index = (offsets * (bins / (hi - lo))).astype("int64")
+    np.clip(index, 0, bins - 1, out=index)
+    # rounding can put a value sitting on an interior edge one bin off, so
+    # check it against the edges themselves like numpy's uniform-bin path
+    index[values < edges[index]] -= 1
+    index[(values >= edges[index + 1]) & (index != bins - 1)] += 1
+    np.clip(index, 0, bins - 1, out=index)
+    return index, in_range
+
+
+def _uniform_histogram2d(
+    x_values: np.ndarray,
+    y_values: np.ndarray,
+    x_edges: np.ndarray,
+    y_edges: np.ndarray,
+) -> np.ndarray:
+    """Count paired values on evenly spaced edges in a single bincount pass.
+
+    Equivalent to ``np.histogram2d`` for the ``np.linspace`` edges built by
+    ``_histogram_edges`` but avoids its per-axis ``searchsorted`` calls.
+
+    Args:
+        x_values (np.ndarray): 1D X values.
+        y_values (np.ndarray): 1D Y values, same length as ``x_values``.
+        x_edges (np.ndarray): Evenly spaced X bin edges.
+        y_edges (np.ndarray): Evenly spaced Y bin edges.
+
+    Returns:
+        np.ndarray: uint32 counts shaped ``(len(x_edges) - 1, len(y_edges) - 1)``.
+    """
+    x_bins = x_edges.size - 1
+    y_bins = y_edges.size - 1
+    x_index, x_in_range = _uniform_bin_index(x_values, x_edges)
+    y_index, y_in_range = _uniform_bin_index(y_values, y_edges)
+    keep = x_in_range & y_in_range
+    flat_index = x_index[keep] * y_bins + y_index[keep]
+    counts = np.bincount(flat_index, minlength=x_bins * y_bins)
+    return counts.reshape(x_bins, y_bins).astype("uint32")
+
+
 def _bounded_sample_append(
     sample: Optional[np.ndarray],
     values: np.ndarray,
     max_points: int,
     rng: np.random.Generator,
 ) -> np.ndarray:
-    """Append values to a bounded approximate sample without retaining all pixels."""
+    """Append values to a bounded approximate sample without retaining all pixels.
+
+    Subsets are drawn without replacement but unshuffled; sample order is never
+    used, and skipping the shuffle makes each draw roughly a third cheaper.
+    """
     if values.size == 0:
         return sample if sample is not None else np.array([], dtype="float64")
 
     values_sample = values
     if values_sample.shape[0] > max_points:
-        idx = rng.choice(values_sample.shape[0], size=max_points, replace=False)
+        idx = rng.choice(
+            values_sample.shape[0], size=max_points, replace=False, shuffle=False
+        )
         values_sample = values_sample[idx]
 
     if sample is None or sample.size == 0:
@@ -1692,7 +2300,9 @@ def _bounded_sample_append(
         combined = np.concatenate([sample, values_sample])
 
     if combined.shape[0] > max_points:
-        idx = rng.choice(combined.shape[0], size=max_points, replace=False)
+        idx = rng.choice(
+            combined.shape[0], size=max_points, replace=False, shuffle=False
+        )
         combined = combined[idx]
     return combined
 
@@ -1713,25 +2323,88 @@ def _summary_from_accumulator(acc: dict) -> Optional[RasterSummary]:
     )
 
 
+def _accumulate_pair_moments(
+    acc: Optional[dict],
+    x_vals: np.ndarray,
+    y_vals: np.ndarray,
+) -> Optional[dict]:
+    """Fold paired values into shifted running sums for correlation and fit.
+
+    Sums are taken relative to the first paired value seen so the single-pass
+    variance/covariance formulas stay numerically stable for large offsets.
+    """
+    if x_vals.size == 0:
+        return acc
+    if acc is None:
+        acc = {
+            "n": 0,
+            "shift_x": float(x_vals[0]),
+            "shift_y": float(y_vals[0]),
+            "sx": 0.0,
+            "sy": 0.0,
+            "sxx": 0.0,
+            "syy": 0.0,
+            "sxy": 0.0,
+        }
+    dx = np.subtract(x_vals, acc["shift_x"], dtype="float64")
+    dy = np.subtract(y_vals, acc["shift_y"], dtype="float64")
+    acc["n"] += int(dx.size)
+    acc["sx"] += float(dx.sum())
+    acc["sy"] += float(dy.sum())
+    acc["sxx"] += float(np.dot(dx, dx))
+    acc["syy"] += float(np.dot(dy, dy))
+    acc["sxy"] += float(np.dot(dx, dy))
+    return acc
+
+
+def _fit_stats_from_moments(
+    acc: Optional[dict],
+) -> tuple[Optional[float], Optional[float], Optional[float]]:
+    """Return Pearson r, OLS slope, and intercept from paired running sums."""
+    if acc is None or acc["n"] < 2:
+        return None, None, None
+    n = acc["n"]
+    mean_dx = acc["sx"] / n
+    mean_dy = acc["sy"] / n
+    var_x = acc["sxx"] / n - mean_dx * mean_dx
+    var_y = acc["syy"] / n - mean_dy * mean_dy
+    cov = acc["sxy"] / n - mean_dx * mean_dy
+    if not var_x > 0:
+        return None, None, None
+
+    slope = cov / var_x
+    intercept = (mean_dy + acc["shift_y"]) - slope * (mean_dx + acc["shift_x"])
+    pearson_r = None
+    if var_y > 0:
+        pearson_r = float(np.clip(cov / np.sqrt(var_x * var_y), -1.0, 1.0))
+    if not (np.isfinite(slope) and np.isfinite(intercept)):
+        return pearson_r, None, None
+    return pearson_r, float(slope), float(intercept)
+
+
 @app.post("/stats/scatter", response_model=ScatterOut)
 def geometry_scatter(scatter_request: GeometryScatterIn):
     job = _register_stats_job(scatter_request.job_id, scatter_request.session_id)
+    opened_rasters = []
+    opened_vrts = []
     try:
         _update_stats_job(job, progress=0.01, message="Preparing stats")
-        logger.debug(
-            "Starting scatter computation: raster_id_x=%r raster_id_y=%r "
-            "geometry=%s from_crs=%r histogram_bins=%s max_points=%s "
-            "all_touched=%s job_id=%r session_id=%r",
-            scatter_request.raster_id_x,
-            scatter_request.raster_id_y,
-            _geometry_log_summary(scatter_request.geometry),
-            scatter_request.from_crs,
-            scatter_request.histogram_bins,
-            scatter_request.max_points,
-            scatter_request.all_touched,
-            scatter_request.job_id,
-            scatter_request.session_id,
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Starting scatter computation: raster_id_x=%r raster_id_y=%r "
+                "geometry=%s from_crs=%r histogram_bins=%s max_points=%s "
+                "all_touched=%s full_stats=%s job_id=%r session_id=%r",
+                scatter_request.raster_id_x,
+                scatter_request.raster_id_y,
+                _geometry_log_summary(scatter_request.geometry),
+                scatter_request.from_crs,
+                scatter_request.histogram_bins,
+                scatter_request.max_points,
+                scatter_request.all_touched,
+                scatter_request.full_stats,
+                scatter_request.job_id,
+                scatter_request.session_id,
+            )
         _update_stats_job(job, progress=0.02, message="Checking stats cache")
         cache_key = _scatter_cache_key(scatter_request)
         cached_response = _scatter_cache_get(cache_key)
@@ -1755,13 +2428,11 @@ def geometry_scatter(scatter_request: GeometryScatterIn):
 
         # helper: reproject a geometry from scatter_request.from_crs to ds.crs
         def _geom_in_ds_crs(ds):
-            if scatter_request.from_crs != ds.crs.to_string():
-                transformer_obj = Transformer.from_crs(
-                    scatter_request.from_crs, ds.crs, always_xy=True
-                )
-                return shp_transform(
-                    lambda x, y, z=None: transformer_obj.transform(x, y),
+            ds_crs = ds.crs.to_string()
+            if scatter_request.from_crs != ds_crs:
+                return _transform_geometry(
                     geom_in_shape,
+                    _get_transformer(scatter_request.from_crs, ds_crs),
                 )
             return geom_in_shape
 
@@ -1789,8 +2460,16 @@ def geometry_scatter(scatter_request: GeometryScatterIn):
             progress_start=None,
             progress_end=None,
             progress_message=None,
+            prefetch=None,
         ):
+            # prefetch(chunk_win) is called just before each chunk is read so
+            # the caller can start dependent I/O that overlaps this read; it
+            # returns a Future, which is yielded back with the chunk or
+            # cancelled if the chunk turns out to hold no geometry pixels
             total_chunks = len(chunk_pairs)
+            # every chunk of a plan shares its geometry, so convert each one
+            # to GeoJSON for rasterize once rather than once per edge chunk
+            chunk_shapes = {}
             for chunk_index, (chunk_geom, chunk_win) in enumerate(chunk_pairs, start=1):
                 _raise_if_stats_job_cancelled(job)
                 if (
@@ -1805,25 +2484,51 @@ def geometry_scatter(scatter_request: GeometryScatterIn):
                         + (progress_end - progress_start) * fraction,
                         message=progress_message,
                     )
+                # chunks wholly outside the geometry are skipped unread, and
+                # chunks wholly inside it need no rasterizing
+                chunk_box = shapely.box(
+                    *rasterio.windows.bounds(chunk_win, ds.transform)
+                )
+                if chunk_geom.disjoint(chunk_box):
+                    continue
+                chunk_covered = chunk_geom.contains(chunk_box)
+
+                prefetched = prefetch(chunk_win) if prefetch is not None else None
                 data = ds.read(1, window=chunk_win, masked=False).astype(
-                    "float64", copy=False
+                    _working_dtype(ds), copy=False
                 )
                 affine = ds.window_transform(chunk_win)
-                mask = geometry_mask(
-                    [mapping(chunk_geom)],
-                    transform=affine,
-                    invert=True,
-                    out_shape=data.shape,
-                    all_touched=bool(all_touched),
-                )
-                if not np.any(mask):
-                    continue
+                if chunk_covered:
+                    mask = np.ones(data.shape, dtype=bool)
+                else:
+                    # burn the geometry straight into a 0/1 byte buffer and
+                    # view it as bool instead of allocating geometry_mask's
+                    # inverted copy
+                    chunk_shape = chunk_shapes.get(id(chunk_geom))
+                    if chunk_shape is None:
+                        chunk_shape = chunk_shapes[id(chunk_geom)] = mapping(
+                            chunk_geom
+                        )
+                    mask_u8 = np.zeros(data.shape, dtype=np.uint8)
+                    rasterize(
+                        [(chunk_shape, 1)],
+                        out=mask_u8,
+                        transform=affine,
+                        all_touched=bool(all_touched),
+                    )
+                    mask = mask_u8.view(bool)
+                    if not mask.any():
+                        # the geometry only grazes this chunk's bounds; drop
+                        # its queued dependent read if it has not started
+                        if prefetched is not None:
+                            prefetched.cancel()
+                        continue
 
                 if nodata_val is not None:
-                    data = np.where(np.isclose(data, nodata_val), np.nan, data)
-
-                valid_mask = mask & np.isfinite(data)
-                yield data, mask, valid_mask, affine, chunk_win
+                    np.putmask(data, _nodata_hits(data, nodata_val), np.nan)
+                valid_mask = np.isfinite(data)
+                valid_mask &= mask
+                yield data, mask, valid_mask, affine, chunk_win, prefetched
                 if (
                     total_chunks > 0
                     and progress_start is not None
@@ -1872,8 +2577,7 @@ def geometry_scatter(scatter_request: GeometryScatterIn):
                     str(rendering.get("type", "")).lower() == "categorical"
                 )
                 ds, nodata_val = _open_raster(raster_id)
-                if nodata_val is None:
-                    nodata_val = rendering.get("nodata")
+                opened_rasters.append(ds)
                 geom_ref_shape = _geom_in_ds_crs(ds)
                 result.update(
                     {
@@ -1892,7 +2596,9 @@ def geometry_scatter(scatter_request: GeometryScatterIn):
                 chunk_pairs = [
                     (plan["geometry"], chunk_win)
                     for plan in plans
-                    for chunk_win in _iter_window_chunks(plan["window"])
+                    for chunk_win in _iter_window_chunks(
+                        plan["window"], block_shape=ds.block_shapes[0]
+                    )
                 ]
                 logger.debug(
                     "Raster %s sampling plan: polygon_windows=%s chunks=%s",
@@ -1914,7 +2620,14 @@ def geometry_scatter(scatter_request: GeometryScatterIn):
                 group_areas = {}
                 group_meta = {}
 
-                for data, mask, valid_mask, affine, _chunk_win in _masked_chunk_values(
+                for (
+                    data,
+                    mask,
+                    valid_mask,
+                    affine,
+                    _chunk_win,
+                    _prefetched,
+                ) in _masked_chunk_values(
                     ds,
                     nodata_val,
                     all_touched,
@@ -1928,16 +2641,18 @@ def geometry_scatter(scatter_request: GeometryScatterIn):
                         affine,
                         ds.crs,
                     )
-                    if not np.any(valid_mask):
+                    # one masked gather gives both the values and their count
+                    vals = data[valid_mask]
+                    if vals.size == 0:
                         continue
 
-                    vals = data[valid_mask]
                     acc["count"] += int(vals.size)
-                    acc["sum"] += float(np.sum(vals))
+                    acc["sum"] += float(np.sum(vals, dtype="float64"))
                     acc["area_hectares"] += valid_area_hectares(
                         valid_mask,
                         affine,
                         ds.crs,
+                        pixel_count=int(vals.size),
                     )
                     if is_categorical:
                         chunk_areas, chunk_meta = categorical_area_totals(
@@ -1984,7 +2699,7 @@ def geometry_scatter(scatter_request: GeometryScatterIn):
                     )
                 elif valid:
                     edges = _histogram_edges(min_value, max_value, bins)
-                    hist = np.histogram(sample_values, bins=edges)[0].astype("int64")
+                    hist = np.histogram(sample_values, bins=edges)[0].astype("uint32")
                     _update_stats_job(
                         job,
                         progress=progress_end,
@@ -2006,24 +2721,28 @@ def geometry_scatter(scatter_request: GeometryScatterIn):
 
             return result
 
-        # loop over both rasters (read, clip, 1D hist)
+        # read both rasters (read, clip, 1D hist) side by side; the passes are
+        # independent and spend most of their time in GDAL and NumPy, which
+        # release the GIL
         bins = scatter_request.histogram_bins
-        results = {
-            "x": _read_clip_hist(
+        with ThreadPoolExecutor(max_workers=2) as read_pool:
+            x_future = read_pool.submit(
+                _read_clip_hist,
                 scatter_request.raster_id_x,
                 bins,
                 scatter_request.all_touched,
                 0.05,
-                0.4,
-            ),
-            "y": _read_clip_hist(
+                0.75,
+            )
+            y_future = read_pool.submit(
+                _read_clip_hist,
                 scatter_request.raster_id_y,
                 bins,
                 scatter_request.all_touched,
-                0.4,
+                0.05,
                 0.75,
-            ),
-        }
+            )
+            results = {"x": x_future.result(), "y": y_future.result()}
 
         x_valid = results["x"]["valid"]
         y_valid = results["y"]["valid"]
@@ -2040,6 +2759,7 @@ def geometry_scatter(scatter_request: GeometryScatterIn):
         )
         x_plot, y_plot = None, None
         valid_pixels = None
+        pearson_r, slope, intercept = None, None, None
 
         # compute 2D histogram on overlapping pixels if both are valid
         if x_hist_valid and y_hist_valid:
@@ -2051,71 +2771,136 @@ def geometry_scatter(scatter_request: GeometryScatterIn):
             y_edges_2d = results["y"]["edges"]
             hist2d = np.zeros(
                 (len(x_edges_2d) - 1, len(y_edges_2d) - 1),
-                dtype="int64",
+                dtype="uint32",
             )
             paired_chunk_pairs = [
                 (plan["geometry"], chunk_win)
                 for plan in x_plans
-                for chunk_win in _iter_window_chunks(plan["window"])
+                for chunk_win in _iter_window_chunks(
+                    plan["window"], block_shape=x_ds.block_shapes[0]
+                )
             ]
             pair_chunk_rng = np.random.default_rng(0)
             paired_chunk_pairs = [
                 paired_chunk_pairs[int(index)]
                 for index in pair_chunk_rng.permutation(len(paired_chunk_pairs))
             ]
-            pair_sample = None
             pair_sample_rng = np.random.default_rng(1)
+            pairs_acc = {"moments": None, "sample": None}
 
-            def _read_y_on_x_grid(x_affine, x_shape):
-                try:
-                    ul = x_affine * (0, 0)
-                    lr = x_affine * (x_shape[1], x_shape[0])
-                    minx, maxx = sorted([ul[0], lr[0]])
-                    miny, maxy = sorted([ul[1], lr[1]])
-
-                    minx_y, miny_y, maxx_y, maxy_y = transform_bounds(
-                        x_ds.crs, y_ds.crs, minx, miny, maxx, maxy, densify_pts=0
+            def _fold_pairs(x_pairs, y_pairs):
+                # returns True once the plotted sample is full
+                pairs_acc["moments"] = _accumulate_pair_moments(
+                    pairs_acc["moments"], x_pairs, y_pairs
+                )
+                if x_pairs.size > scatter_request.max_points:
+                    # subsample before stacking so we never build an N x 2 copy
+                    keep_idx = pair_sample_rng.choice(
+                        x_pairs.size,
+                        size=scatter_request.max_points,
+                        replace=False,
+                        shuffle=False,
                     )
+                    x_pairs = x_pairs[keep_idx]
+                    y_pairs = y_pairs[keep_idx]
+                pairs_acc["sample"] = _bounded_sample_append(
+                    pairs_acc["sample"],
+                    np.column_stack([x_pairs, y_pairs]),
+                    scatter_request.max_points,
+                    pair_sample_rng,
+                )
+                return pairs_acc["sample"].shape[0] >= scatter_request.max_points
+
+            # when the geometry covers far more pixels than the plot needs,
+            # pair a decimated read of the whole window instead of full
+            # resolution chunks; GDAL serves it from overviews when present and
+            # the sample is spread over the entire geometry, not one chunk
+            x_total_pixels = sum(
+                int(plan["window"].width) * int(plan["window"].height)
+                for plan in x_plans
+            )
+            # no plotted sample is requested when max_points <= 0, so there is
+            # nothing to decimate for
+            decimation = (
+                int(np.sqrt(x_total_pixels / (4 * scatter_request.max_points)))
+                if scatter_request.max_points > 0
+                else 0
+            )
+            use_decimated = not scatter_request.full_stats and decimation >= 2
 
-                    y_win = from_bounds(
-                        minx_y, miny_y, maxx_y, maxy_y, transform=y_ds.transform
-                    )
-                    y_win = (
-                        y_win.round_offsets()
-                        .round_lengths()
-                        .intersection(Window(0, 0, y_ds.width, y_ds.height))
+            # rasters sharing a pixel grid skip the warper entirely
+            y_offset = _aligned_pixel_offset(y_ds, x_ds)
+            if y_offset is not None:
+
+                def _read_y_on_x_grid(x_chunk_win, out_shape=None):
+                    return _read_aligned_window(
+                        y_ds, y_nodata, y_offset, x_chunk_win, out_shape=out_shape
                     )
-                    if int(y_win.width) <= 0 or int(y_win.height) <= 0:
-                        return np.full(x_shape, np.nan, dtype="float64")
 
-                    y_src = y_ds.read(1, window=y_win, masked=False).astype(
-                        "float64", copy=False
+            else:
+                y_vrt_entry = _warped_vrt_on_grid(
+                    y_ds.name,
+                    y_nodata,
+                    x_ds.crs.to_wkt(),
+                    x_ds.transform,
+                    x_ds.width,
+                    x_ds.height,
+                )
+                opened_vrts.append(y_vrt_entry)
+
+                def _read_y_on_x_grid(x_chunk_win, out_shape=None):
+                    with y_vrt_entry.lock:
+                        return y_vrt_entry.vrt.read(
+                            1,
+                            window=x_chunk_win,
+                            out_shape=out_shape,
+                            resampling=Resampling.nearest,
+                        )
+
+            if use_decimated:
+                x_nodata = results["x"]["nodata"]
+                for plan in x_plans:
+                    _raise_if_stats_job_cancelled(job)
+                    win = plan["window"]
+                    out_shape = (
+                        max(1, int(np.ceil(win.height / decimation))),
+                        max(1, int(np.ceil(win.width / decimation))),
                     )
-                    if y_nodata is not None:
-                        y_src = np.where(np.isclose(y_src, y_nodata), np.nan, y_src)
-                    y_affine = y_ds.window_transform(y_win)
-
-                    y_on_xgrid = np.full(x_shape, np.nan, dtype="float64")
-                    reproject(
-                        source=y_src,
-                        destination=y_on_xgrid,
-                        src_transform=y_affine,
-                        src_crs=y_ds.crs,
-                        src_nodata=np.nan if y_nodata is not None else None,
-                        dst_transform=x_affine,
-                        dst_crs=x_ds.crs,
-                        dst_nodata=np.nan,
+                    data = x_ds.read(
+                        1,
+                        window=win,
+                        out_shape=out_shape,
                         resampling=Resampling.nearest,
-                        num_threads=0,
+                        masked=False,
+                    ).astype(_working_dtype(x_ds), copy=False)
+                    if x_nodata is not None:
+                        np.putmask(data, _nodata_hits(data, x_nodata), np.nan)
+                    affine = x_ds.window_transform(win) * Affine.scale(
+                        win.width / out_shape[1], win.height / out_shape[0]
                     )
-                    return y_on_xgrid
-                except WindowError:
-                    return np.full(x_shape, np.nan, dtype="float64")
-
-            for (
-                pair_chunk_index,
-                (data, _mask, valid_mask, affine, _chunk_win),
-            ) in enumerate(_masked_chunk_values(
+                    mask_u8 = np.zeros(out_shape, dtype=np.uint8)
+                    rasterize(
+                        [(mapping(plan["geometry"]), 1)],
+                        out=mask_u8,
+                        transform=affine,
+                        all_touched=bool(scatter_request.all_touched),
+                    )
+                    y_on_xgrid = _read_y_on_x_grid(win, out_shape=out_shape)
+                    finite_mask = np.isfinite(y_on_xgrid)
+                    finite_mask &= np.isfinite(data)
+                    finite_mask &= mask_u8.view(bool)
+                    pair_idx = np.flatnonzero(finite_mask)
+                    if pair_idx.size:
+                        _fold_pairs(
+                            data.ravel().take(pair_idx),
+                            y_on_xgrid.ravel().take(pair_idx),
+                        )
+                paired_chunk_pairs = []
+
+            # read each chunk's Y values on a worker while the X chunk is read
+            # and masked on this thread
+            y_read_pool = ThreadPoolExecutor(max_workers=1)
+            paired_chunks = _masked_chunk_values(
                 x_ds,
                 results["x"]["nodata"],
                 scatter_request.all_touched,
@@ -2123,41 +2908,41 @@ def geometry_scatter(scatter_request: GeometryScatterIn):
                 progress_start=0.75,
                 progress_end=0.98,
                 progress_message="Sampling paired scatter",
-            ), start=1):
-                _raise_if_stats_job_cancelled(job)
-                if not np.any(valid_mask):
-                    continue
-                y_on_xgrid = _read_y_on_x_grid(affine, data.shape)
-                finite_mask = valid_mask & np.isfinite(y_on_xgrid)
-                if not np.any(finite_mask):
-                    continue
+                prefetch=lambda win: y_read_pool.submit(_read_y_on_x_grid, win),
+            )
+            with y_read_pool:
+                for data, _mask, valid_mask, _affine, _win, y_future in paired_chunks:
+                    _raise_if_stats_job_cancelled(job)
+                    y_on_xgrid = y_future.result()
+                    # resolve the paired pixel positions once and gather both
+                    # rasters from them rather than scanning the mask twice;
+                    # an all-invalid X chunk simply yields no positions
+                    finite_mask = np.isfinite(y_on_xgrid)
+                    finite_mask &= valid_mask
+                    pair_idx = np.flatnonzero(finite_mask)
+                    if pair_idx.size == 0:
+                        continue
 
-                x_pairs = data[finite_mask]
-                y_pairs = y_on_xgrid[finite_mask]
-                chunk_pairs = np.column_stack([x_pairs, y_pairs])
-                pair_sample = _bounded_sample_append(
-                    pair_sample,
-                    chunk_pairs,
-                    scatter_request.max_points,
-                    pair_sample_rng,
-                )
-                if (
-                    pair_sample is not None
-                    and pair_sample.shape[0] >= scatter_request.max_points
-                ):
-                    break
+                    sample_full = _fold_pairs(
+                        data.ravel().take(pair_idx),
+                        y_on_xgrid.ravel().take(pair_idx),
+                    )
+                    # by default r/slope/intercept come from the pairs read
+                    # until the plotted sample is full; full_stats keeps
+                    # folding every paired pixel into the running sums
+                    if sample_full and not scatter_request.full_stats:
+                        break
+
+            pair_sample = pairs_acc["sample"]
+            pair_moments = pairs_acc["moments"]
 
             x_edges_out, y_edges_out = x_edges_2d, y_edges_2d
             if pair_sample is not None and pair_sample.size > 0:
                 x_plot = pair_sample[:, 0]
                 y_plot = pair_sample[:, 1]
-                hist2d_counts, _x_edges_unused, _y_edges_unused = np.histogram2d(
-                    x_plot,
-                    y_plot,
-                    bins=[x_edges_2d, y_edges_2d],
-                )
-                hist2d = hist2d_counts.astype("int64")
+                hist2d = _uniform_histogram2d(x_plot, y_plot, x_edges_2d, y_edges_2d)
                 valid_pixels = int(pair_sample.shape[0])
+            pearson_r, slope, intercept = _fit_stats_from_moments(pair_moments)
             _update_stats_job(
                 job,
                 progress=0.98,
@@ -2174,33 +2959,20 @@ def geometry_scatter(scatter_request: GeometryScatterIn):
         response = ScatterOut(
             raster_id_x=scatter_request.raster_id_x,
             raster_id_y=scatter_request.raster_id_y,
-            x=x_plot.tolist() if x_plot is not None else None,
-            y=y_plot.tolist() if y_plot is not None else None,
-            hist2d=hist2d.tolist() if hist2d is not None else None,
-            x_edges=(
-                x_edges_out.tolist()
-                if isinstance(x_edges_out, np.ndarray)
-                else (x_edges_out if x_edges_out is None else list(x_edges_out))
-            ),
-            y_edges=(
-                y_edges_out.tolist()
-                if isinstance(y_edges_out, np.ndarray)
-                else (y_edges_out if y_edges_out is None else list(y_edges_out))
-            ),
-            hist1d_x=(
-                results["x"]["hist"].tolist()
-                if results["x"]["hist"] is not None
-                else None
-            ),
-            hist1d_y=(
-                results["y"]["hist"].tolist()
-                if results["y"]["hist"] is not None
-                else None
-            ),
+            x=_encode_array(x_plot, "<f4"),
+            y=_encode_array(y_plot, "<f4"),
+            hist2d=_encode_array(hist2d, "<u4"),
+            x_edges=_encode_array(x_edges_out, "<f8"),
+            y_edges=_encode_array(y_edges_out, "<f8"),
+            hist1d_x=_encode_array(results["x"]["hist"], "<u4"),
+            hist1d_y=_encode_array(results["y"]["hist"], "<u4"),
             x_summary=results["x"]["summary"] if x_hist_valid else None,
             y_summary=results["y"]["summary"] if y_hist_valid else None,
             x_categories=results["x"]["categories"],
             y_categories=results["y"]["categories"],
+            pearson_r=pearson_r,
+            slope=slope,
+            intercept=intercept,
             valid_pixels=valid_pixels,
             plot_sampled=bool(x_hist_valid or y_hist_valid),
             geometry=scatter_request.geometry,
@@ -2233,6 +3005,39 @@ def geometry_scatter(scatter_request: GeometryScatterIn):
             status_code=500,
             detail=f"Scatter computation failed: {type(e).__name__}: {e}",
         )
+    finally:
+        for entry in opened_vrts:
+            _release_warped_vrt(entry)
+        for ds in opened_rasters:
+            _release_raster(ds)
+
+
+def _raster_category_labels(raster_id: str) -> dict:
+    """Return the ``{class value: label}`` map of a categorical layer, or {}."""
+    layer_cfg = REGISTRY.get(raster_id.lower(), {})
+    return (layer_cfg.get("rendering") or {}).get("category_labels") or {}
+
+
+def _pixel_output_value(value, nodata, category_labels: dict):
+    """Convert a raw pixel value to the value reported by the pixel endpoints.
+
+    Args:
+        value: Raw pixel value as read from the raster.
+        nodata (float | None): Nodata value from `_open_raster`.
+        category_labels (dict): Labels from `_raster_category_labels`.
+
+    Returns:
+        Optional[Union[float, str]]: None for nodata or non-finite values,
+        the class label for labelled categorical values, else the value.
+    """
+    v = float(value)
+    if not np.isfinite(v) or (nodata is not None and _nodata_hits(v, nodata)):
+        return None
+    if category_labels:
+        label = category_labels.get(int(v))
+        if label is not None:
+            return label
+    return v
 
 
 @app.post("/stats/pixel_val", response_model=PixelValOut)
@@ -2243,16 +3048,20 @@ def pixel_val(req: PixelValIn):
     and returns the nearest pixel value. Nodata or non-finite values are returned
     as `None`. If the point is out of bounds, `in_bounds=False` with `value=None`.
     """
+    ds = None
     try:
         ds, nodata = _open_raster(req.raster_id)
 
-        if req.from_crs and ds.crs and req.from_crs != ds.crs.to_string():
-            tf = Transformer.from_crs(req.from_crs, ds.crs, always_xy=True)
+        ds_crs = ds.crs.to_string() if ds.crs else None
+        if req.from_crs and ds_crs and req.from_crs != ds_crs:
+            tf = _get_transformer(req.from_crs, ds_crs)
             x, y = tf.transform(req.lon, req.lat)
         else:
             x, y = req.lon, req.lat
 
-        r, c = rasterio.transform.rowcol(ds.transform, x, y)
+        # invert the affine directly; rowcol builds a GDAL transformer per call
+        col_f, row_f = ~ds.transform * (x, y)
+        r, c = int(np.floor(row_f)), int(np.floor(col_f))
         if r < 0 or c < 0 or r >= ds.height or c >= ds.width:
             return PixelValOut(
                 raster_id=req.raster_id,
@@ -2266,21 +3075,9 @@ def pixel_val(req: PixelValIn):
 
         win = Window(c, r, 1, 1)
         arr = ds.read(1, window=win, masked=False)
-        v = float(arr[0, 0])
-
-        if (nodata is not None and np.isclose(v, nodata)) or (not np.isfinite(v)):
-            val = None
-        else:
-            val = v
-
-        layer_cfg = REGISTRY.get(req.raster_id.lower(), {})
-        category_labels = (layer_cfg.get("rendering") or {}).get(
-            "category_labels"
-        ) or {}
-        if val is not None and category_labels:
-            label = category_labels.get(int(val))
-            if label is not None:
-                val = label
+        val = _pixel_output_value(
+            arr[0, 0], nodata, _raster_category_labels(req.raster_id)
+        )
 
         return PixelValOut(
             raster_id=req.raster_id,
@@ -2300,10 +3097,113 @@ def pixel_val(req: PixelValIn):
             status_code=500,
             detail=f"Pixel value query failed: {type(e).__name__}: {e}",
         )
+    finally:
+        _release_raster(ds)
+
+
+@app.post("/stats/pixel_vals", response_model=PixelValsOut)
+def pixel_vals(req: PixelValsIn):
+    """Return the values of the pixels containing many coordinates at once.
+
+    Batched form of `pixel_val` for one raster: every coordinate is projected
+    with a single PROJ call and located with one vectorized inverse affine,
+    and when the in-bounds pixels are close together they are fetched with
+    a single window read. Each result follows `pixel_val`'s conventions.
+    """
+    if len(req.lons) != len(req.lats):
+        raise HTTPException(
+            status_code=400, detail="lons and lats must have the same length"
+        )
+    if len(req.lons) > _PIXEL_BATCH_MAX_POINTS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"at most {_PIXEL_BATCH_MAX_POINTS} points per request",
+        )
+    ds = None
+    try:
+        ds, nodata = _open_raster(req.raster_id)
+
+        xs = np.asarray(req.lons, dtype="float64")
+        ys = np.asarray(req.lats, dtype="float64")
+        ds_crs = ds.crs.to_string() if ds.crs else None
+        if xs.size and req.from_crs and ds_crs and req.from_crs != ds_crs:
+            tf = _get_transformer(req.from_crs, ds_crs)
+            xs, ys = tf.transform(xs, ys)
+
+        col_f, row_f = ~ds.transform * (np.asarray(xs), np.asarray(ys))
+        in_bounds = np.isfinite(col_f) & np.isfinite(row_f)
+        rows = np.zeros(xs.size, dtype="int64")
+        cols = np.zeros(xs.size, dtype="int64")
+        rows[in_bounds] = np.floor(row_f[in_bounds])
+        cols[in_bounds] = np.floor(col_f[in_bounds])
+        in_bounds &= (rows >= 0) & (cols >= 0)
+        in_bounds &= (rows < ds.height) & (cols < ds.width)
+
+        raw_values = np.full(xs.size, np.nan)
+        hit_idx = np.flatnonzero(in_bounds)
+        if hit_idx.size:
+            row0, row1 = int(rows[hit_idx].min()), int(rows[hit_idx].max()) + 1
+            col0, col1 = int(cols[hit_idx].min()), int(cols[hit_idx].max()) + 1
+            if (row1 - row0) * (col1 - col0) <= _PIXEL_BATCH_MAX_WINDOW_PIXELS:
+                block = ds.read(
+                    1,
+                    window=Window(col0, row0, col1 - col0, row1 - row0),
+                    masked=False,
+                )
+                raw_values[hit_idx] = block[
+                    rows[hit_idx] - row0, cols[hit_idx] - col0
+                ]
+            else:
+                # scattered points: a bounding window would read mostly
+                # unused pixels, so fetch each one on its own
+                for i in hit_idx:
+                    raw_values[i] = ds.read(
+                        1, window=Window(int(cols[i]), int(rows[i]), 1, 1)
+                    )[0, 0]
+
+        category_labels = _raster_category_labels(req.raster_id)
+        points = []
+        for i, (lon, lat) in enumerate(zip(req.lons, req.lats)):
+            if not in_bounds[i]:
+                points.append(
+                    PixelValOut(
+                        raster_id=req.raster_id,
+                        lon=lon,
+                        lat=lat,
+                        in_bounds=False,
+                    )
+                )
+                continue
+            points.append(
+                PixelValOut(
+                    raster_id=req.raster_id,
+                    lon=lon,
+                    lat=lat,
+                    row=int(rows[i]),
+                    col=int(cols[i]),
+                    in_bounds=True,
+                    value=_pixel_output_value(
+                        raw_values[i], nodata, category_labels
+                    ),
+                )
+            )
+        return PixelValsOut(raster_id=req.raster_id, points=points)
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.exception("pixel_vals failed")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Pixel values query failed: {type(e).__name__}: {e}",
+        )
+    finally:
+        _release_raster(ds)
 
 
 @app.post("/download/clip")
 def download_clip(req: ClipIn):
+    x_ds = y_ds = None
     try:
         if not req.raster_id_x and not req.raster_id_y:
             raise HTTPException(
@@ -2311,11 +3211,11 @@ def download_clip(req: ClipIn):
                 detail="At least one of raster_id_x or raster_id_y must be provided",
             )
 
-        x_ds = x_nodata = y_ds = y_nodata = None
+        x_nodata = y_nodata = None
         if req.raster_id_x:
-            x_ds, x_nodata = _open_raster(req.raster_id_x)
+            x_ds, x_nodata = _open_raster(req.raster_id_x, stats_nodata=False)
         if req.raster_id_y:
-            y_ds, y_nodata = _open_raster(req.raster_id_y)
+            y_ds, y_nodata = _open_raster(req.raster_id_y, stats_nodata=False)
 
         ref_ds = x_ds or y_ds
         if ref_ds is None:
@@ -2363,14 +3263,6 @@ def download_clip(req: ClipIn):
             for p in out_paths:
                 zf.write(p, arcname=p.name)
 
-        # close datasets before returning
-        for d in (x_ds, y_ds):
-            try:
-                if d:
-                    d.close()
-            except Exception:
-                pass
-
         def _cleanup():
             try:
                 shutil.rmtree(temp_dir, ignore_errors=True)
@@ -2392,3 +3284,6 @@ def download_clip(req: ClipIn):
             status_code=500,
             detail=f"Clip download failed: {type(e).__name__}: {e}",
         )
+    finally:
+        _release_raster(x_ds)
+        _release_raster(y_ds)
@@ -32,9 +32,11 @@ Example:
             default_style: my_style
 """
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Any
 import argparse
+import hashlib
 import logging
 import os
 import secrets
@@ -47,6 +49,7 @@ from dotenv import load_dotenv
 from rasterio.crs import CRS
 from rasterio.enums import Resampling
 from rasterio.windows import Window
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
 import numpy as np
 import rasterio
@@ -66,6 +69,11 @@ requests.packages.urllib3.disable_warnings()  # noqa: E402
 load_dotenv()
 
 PASSWORD_LENGTH = 16
+# libyaml's C loader is much faster, but only present when PyYAML was built
+# against libyaml
+YAML_SAFE_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+# keep-alive connections the GeoServer REST client may hold open
+GS_POOL_SIZE = 16
 
 
 class Gs:
@@ -90,9 +98,21 @@ class Gs:
         """
         self.base = base_url.rstrip("/")
         self.auth = (user, password)
+        # short fingerprint so the identity tracks the credential without
+        # holding the password itself in the key
+        self._cred_fp = hashlib.sha1(password.encode("utf-8")).hexdigest()[:12]
         self.timeout = timeout
         self.headers_xml = {"Content-Type": "text/xml"}
         self.headers_json = {"Content-Type": "application/json"}
+        self.headers_accept_json = {"Accept": "application/json"}
+        # one keep-alive session so every REST call reuses pooled connections
+        # instead of opening a new TCP (and TLS) connection per request
+        self.session = requests.Session()
+        self.session.auth = self.auth
+        self.session.verify = False
+        adapter = HTTPAdapter(pool_connections=GS_POOL_SIZE, pool_maxsize=GS_POOL_SIZE)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
 
     # defining these so the identity is stable in logs and collections
     def _key(self):
@@ -148,12 +168,10 @@ class Gs:
         Returns:
             requests.Response: The HTTP response object.
         """
-        return requests.get(
+        return self.session.get(
             self._url(path),
-            auth=self.auth,
-            headers={"Accept": "application/json"},
+            headers=self.headers_accept_json,
             timeout=self.timeout,
-            verify=False,
         )
 
     def post(self, path: str, data: Any) -> requests.Response:
@@ -167,13 +185,11 @@ class Gs:
         Returns:
             requests.Response: The HTTP response object.
         """
-        return requests.post(
+        return self.session.post(
             self._url(path),
-            auth=self.auth,
             headers=self.headers_json,
             json=data,
             timeout=self.timeout,
-            verify=False,
         )
 
     def put(self, path: str, data: Any) -> requests.Response:
@@ -187,13 +203,11 @@ class Gs:
         Returns:
             requests.Response: The HTTP response object.
         """
-        return requests.put(
+        return self.session.put(
             self._url(path),
-            auth=self.auth,
             headers=self.headers_json,
             json=data,
             timeout=self.timeout,
-            verify=False,
         )
 
     def delete(self, path: str) -> requests.Response:
@@ -214,9 +228,7 @@ class Gs:
         Raises:
             requests.RequestException: If the request fails due to a network
         """
-        return requests.delete(
-            self._url(path), auth=self.auth, timeout=self.timeout, verify=False
-        )
+        return self.session.delete(self._url(path), timeout=self.timeout)
 
 
 def purge_and_create_workspace(geoserver_client: Gs, workspace_name: str) -> None:
@@ -249,11 +261,18 @@ def purge_and_create_workspace(geoserver_client: Gs, workspace_name: str) -> Non
     if not isinstance(workspaces, list):
         workspaces = [workspaces]
 
-    for ws in workspaces:
-        name = ws.get("name")
-        if not name:
-            continue
-        del_resp = geoserver_client.delete(f"/rest/workspaces/{name}?recurse=true")
+    names = [ws.get("name") for ws in workspaces if ws.get("name")]
+
+    def _delete_workspace(name):
+        return geoserver_client.delete(f"/rest/workspaces/{name}?recurse=true")
+
+    # each recursive delete blocks on GeoServer, so issue them concurrently
+    # over the client's pooled connections
+    max_workers = max(1, min(GS_POOL_SIZE, len(names)))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        del_responses = list(executor.map(_delete_workspace, names))
+
+    for name, del_resp in zip(names, del_responses):
         if del_resp.status_code in (200, 202, 204, 404):
             logger.info("Deleted workspace '%s' (if existed).", name)
         else:
@@ -515,21 +534,18 @@ def create_style_if_not_exists(
                 f"{response.status_code} {response.text}\nPayload: {style_payload}"
             )
 
-    # Upload or update style body
-    with open(style_file_path, "r", encoding="utf-8") as style_file:
-        style_body = style_file.read().encode("utf-8")
-
+    # Upload or update style body, streamed from disk rather than read into
+    # memory first
     style_url = geoserver_client._url(
         f"/rest/workspaces/{workspace_name}/styles/{style_name}{file_extension}?raw=true"
     )
-    upload_response = requests.put(
-        style_url,
-        auth=geoserver_client.auth,
-        headers={"Content-Type": content_type},
-        data=style_body,
-        timeout=geoserver_client.timeout,
-        verify=False,
-    )
+    with open(style_file_path, "rb") as style_file:
+        upload_response = geoserver_client.session.put(
+            style_url,
+            headers={"Content-Type": content_type},
+            data=style_file,
+            timeout=geoserver_client.timeout,
+        )
     if upload_response.status_code not in (200, 201):
         raise RuntimeError(
             f"Failed to upload style {workspace_name}:{style_name}: "
@@ -632,13 +648,11 @@ def create_categorical_raster_style(
         f"/rest/workspaces/{workspace_name}/styles/{style_name}.sld?raw=true"
     )
 
-    upload_response = requests.put(
+    upload_response = geoserver_client.session.put(
         style_upload_url,
-        auth=geoserver_client.auth,
         headers={"Content-Type": "application/vnd.ogc.sld+xml"},
         data=sld_body.encode("utf-8"),
         timeout=geoserver_client.timeout,
-        verify=False,
     )
 
     if upload_response.status_code not in (200, 201):
@@ -857,7 +871,7 @@ def main():
     if expanded_yaml != raw_yaml:
         logger.info("Expanded environment variables in config YAML")
 
-    config_data = yaml.safe_load(expanded_yaml)
+    config_data = yaml.load(expanded_yaml, Loader=YAML_SAFE_LOADER)
     logger.info(f"Parsed YAML config from {expanded_yaml}")
     logger.info(config_data)
     geoserver_base_url = config_data["geoserver"]["base_url"]
@@ -933,7 +947,7 @@ def main():
             )
             raise ValueError(formatted)
 
-    for raster_id, layer_def in all_layers.items():
+    def _register_layer(raster_id, layer_def):
         logger.debug("Layer definition (%s): %s", raster_id, layer_def)
 
         file_path = Path(layer_def["file_path"])
@@ -965,7 +979,28 @@ def main():
             file_path,
             style_id,
         )
-        scheduled_layers += 1
+
+    # each layer's style -> store -> coverage -> layer calls must stay in
+    # order, but different layers are independent, so register them
+    # concurrently over the client's pooled connections
+    with ThreadPoolExecutor(max_workers=GS_POOL_SIZE) as executor:
+        layer_futures = {
+            executor.submit(_register_layer, raster_id, layer_def): raster_id
+            for raster_id, layer_def in all_layers.items()
+        }
+        for layer_future in as_completed(layer_futures):
+            try:
+                layer_future.result()
+            except Exception:
+                # stop like a serial loop would: layers not yet started are
+                # dropped, those already in flight are allowed to finish
+                logger.error(
+                    "Registering layer %s failed, cancelling the remaining layers",
+                    layer_futures[layer_future],
+                )
+                executor.shutdown(wait=True, cancel_futures=True)
+                raise
+            scheduled_layers += 1
 
     logger.info(
         "Registered layers in GeoServer (layers=%d).",
@@ -1460,6 +1460,56 @@ function isIgnorableStatsError(err) {
   );
 }
 
+/**
+ * Decode a base64 string of packed little-endian values into a plain array.
+ *
+ * @param {string|null|undefined} encoded - Base64 payload from the rstats service.
+ * @param {Function} ArrayType - Typed array constructor matching the packed dtype.
+ * @returns {number[]|null} Decoded values, or null when nothing was sent.
+ */
+function decodeBase64Array(encoded, ArrayType) {
+  if (typeof encoded !== "string") return null;
+  const binary = atob(encoded);
+  const bytes = new Uint8Array(binary.length);
+  for (let i = 0; i < binary.length; i++) {
+    bytes[i] = binary.charCodeAt(i);
+  }
+  return Array.from(new ArrayType(bytes.buffer));
+}
+
+/**
+ * Expand the packed array fields of a `/stats/scatter` response into the
+ * plain arrays used by the plotting code.
+ *
+ * @param {Object} result - Raw JSON response from `/stats/scatter`.
+ * @returns {Object} Scatter object with `x`, `y`, edges, and histograms as arrays.
+ */
+function decodeScatterArrays(result) {
+  const xEdges = decodeBase64Array(result.x_edges, Float64Array);
+  const yEdges = decodeBase64Array(result.y_edges, Float64Array);
+  const hist2dFlat = decodeBase64Array(result.hist2d, Uint32Array);
+
+  let hist2d = null;
+  if (hist2dFlat && xEdges && yEdges) {
+    const ny = yEdges.length - 1;
+    hist2d = [];
+    for (let i = 0; i < xEdges.length - 1; i++) {
+      hist2d.push(hist2dFlat.slice(i * ny, (i + 1) * ny));
+    }
+  }
+
+  return {
+    ...result,
+    x: decodeBase64Array(result.x, Float32Array),
+    y: decodeBase64Array(result.y, Float32Array),
+    hist2d,
+    hist1d_x: decodeBase64Array(result.hist1d_x, Uint32Array),
+    hist1d_y: decodeBase64Array(result.hist1d_y, Uint32Array),
+    x_edges: xEdges,
+    y_edges: yEdges,
+  };
+}
+
 /**
  * POST a geometry to the rstats service and return scatter data for two rasters.
  * @param {string} rasterIdX
@@ -1503,7 +1553,7 @@ async function fetchScatterStats(rasterIdX, rasterIdY, geojson, opts = {}) {
       throw makeStatsCancelledError();
     }
     if (!res.ok) throw new Error(await res.text());
-    const result = await res.json();
+    const result = decodeScatterArrays(await res.json());
     if (!isCurrentStatsJob(job)) {
       throw makeStatsStaleError();
     }